@@ -5,8 +5,56 @@
 
 set -euo pipefail
 
+# Detected dependency versions keyed by command name, filled by detect_dependency_version.
+# Declared without a value so re-sourcing this library keeps versions already detected.
+declare -gA DEPENDENCY_VERSIONS
+
 # --- Functions ---
 
+# Function: detect_dependency_version
+# Purpose: Detects the installed version of a command once and caches it in DEPENDENCY_VERSIONS,
+#          so validating a dependency and then displaying its version only runs `--version` once.
+#          Call it in the current shell (not inside $(...)) so the cache is kept.
+# Arguments:
+#   $1 - command_name: The name of the command (must be installed).
+# Returns: 0; the version is stored in DEPENDENCY_VERSIONS[command_name].
+detect_dependency_version() {
+    local cmd="$1"
+
+    # `export -f` carries this function into child shells, but bash cannot export an
+    # associative array; without this, the first assignment below would create an indexed
+    # array where every command name maps to element 0.
+    declare -p DEPENDENCY_VERSIONS &>/dev/null || declare -gA DEPENDENCY_VERSIONS
+
+    if [ -n "${DEPENDENCY_VERSIONS[$cmd]:-}" ]; then
+        return 0
+    fi
+
+    local current_version
+    case "$cmd" in
+        node)
+            current_version=$(node --version | sed 's/v//')
+            ;;
+        npm)
+            current_version=$(npm --version)
+            ;;
+        jq)
+            current_version=$(jq --version | sed 's/jq-//')
+            ;;
+        bash)
+            # The scripts run under `#!/usr/bin/env bash`, i.e. the bash found in PATH,
+            # so read the running shell's version instead of spawning another one
+            current_version="${BASH_VERSINFO[0]}.${BASH_VERSINFO[1]}.${BASH_VERSINFO[2]}"
+            ;;
+        *)
+            # Generic version extraction
+            current_version=$($cmd --version 2>&1 | grep -oP '\d+\.\d+(\.\d+)?' | head -1)
+            ;;
+    esac
+
+    DEPENDENCY_VERSIONS[$cmd]="$current_version"
+}
+
 # Function: validate_dependency
 # Purpose: Checks if a command exists and meets a minimum version requirement.
 # Arguments:
@@ -23,25 +71,8 @@ validate_dependency() {
     fi
 
     if [ -n "$min_version" ]; then
-        local current_version
-        case "$cmd" in
-            node)
-                current_version=$(node --version | sed 's/v//')
-                ;;
-            npm)
-                current_version=$(npm --version)
-                ;;
-            jq)
-                current_version=$(jq --version | sed 's/jq-//')
-                ;;
-            bash)
-                current_version=$(bash --version | head -1 | grep -oP '\d+\.\d+\.\d+')
-                ;;
-            *)
-                # Generic version extraction
-                current_version=$($cmd --version 2>&1 | grep -oP '\d+\.\d+(\.\d+)?' | head -1)
-                ;;
-        esac
+        detect_dependency_version "$cmd"
+        local current_version="${DEPENDENCY_VERSIONS[$cmd]}"
 
         if ! version_compare "$current_version" "$min_version"; then
             echo "ERROR: $cmd version $current_version < $min_version (required)" >&2
@@ -273,6 +304,7 @@ validate_mcp_profile_update_guard() {
 
 # --- Exports ---
 # Export functions for use in other scripts.
+export -f detect_dependency_version
 export -f validate_dependency
 export -f version_compare
 export -f validate_env
@@ -12,6 +12,9 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 PROJECT_ROOT="$(cd "$SCRIPT_DIR/../.." && pwd)"
 CI_SCRIPT="$PROJECT_ROOT/scripts/local-ci/run.sh" # Path to the main CI/CD script
 LOGS_DIR="$PROJECT_ROOT/logs" # Path to the directory where logs are stored
+CI_LIB_DIR="$PROJECT_ROOT/scripts/local-ci/lib" # Path to the CI/CD helper libraries
+VALIDATOR_SCRIPT="$CI_LIB_DIR/validator.sh" # Dependency validator sourced by the environment check
+CLEANUP_SCRIPT="$CI_LIB_DIR/cleanup-logs.sh" # Log retention script used by the clean logs action
 
 # Colors for styled output in the terminal.
 GREEN='\033[0;32m'
@@ -211,7 +214,8 @@ view_logs() {
     echo -e "${CYAN}╚════════════════════════════════════════════════════════════════╝${NC}"
     echo ""
 
-    if [ ! -d "$LOGS_DIR" ] || [ -z "$(ls -A "$LOGS_DIR" 2>/dev/null)" ]; then
+    # compgen is a builtin glob, so checking for logs does not fork `ls`
+    if [ ! -d "$LOGS_DIR" ] || ! compgen -G "$LOGS_DIR/*.json" > /dev/null; then
         echo -e "${YELLOW}No logs found in $LOGS_DIR${NC}"
         pause
         return
@@ -251,8 +255,8 @@ check_environment() {
     echo ""
 
     # Source validator to check dependencies
-    if [ -f "$PROJECT_ROOT/scripts/local-ci/lib/validator.sh" ]; then
-        source "$PROJECT_ROOT/scripts/local-ci/lib/validator.sh"
+    if [ -f "$VALIDATOR_SCRIPT" ]; then
+        source "$VALIDATOR_SCRIPT"
 
         echo -e "${GREEN}Checking dependencies...${NC}"
         echo ""
@@ -270,7 +274,8 @@ check_environment() {
             printf "  %-20s" "$name:"
 
             if validate_dependency "$cmd" "$min_ver" 2>/dev/null; then
-                version=$($cmd --version 2>&1 | grep -oP '\d+\.\d+(\.\d+)?' | head -1)
+                # Reuse the version detected during validation instead of running --version again
+                version="${DEPENDENCY_VERSIONS[$cmd]:-}"
                 echo -e "${GREEN}✓${NC} $version"
             else
                 echo -e "${RED}✗${NC} Not found or version < $min_ver"
@@ -322,10 +327,9 @@ clean_logs() {
     echo ""
 
     # Run cleanup script
-    cleanup_script="$PROJECT_ROOT/scripts/local-ci/lib/cleanup-logs.sh"
-    if [ -f "$cleanup_script" ]; then
+    if [ -f "$CLEANUP_SCRIPT" ]; then
         echo -e "${YELLOW}Running cleanup (keeps last 30 days)...${NC}"
-        bash "$cleanup_script"
+        bash "$CLEANUP_SCRIPT"
 
         new_count=$(find "$LOGS_DIR" -name "*.json" -type f | wc -l)
         removed=$((current_count - new_count))
@@ -337,7 +341,7 @@ clean_logs() {
             echo -e "${GREEN}✓ No logs older than 30 days${NC}"
         fi
     else
-        echo -e "${RED}Cleanup script not found at $cleanup_script${NC}"
+        echo -e "${RED}Cleanup script not found at $CLEANUP_SCRIPT${NC}"
     fi
 
     pause